@@ -1,411 +1,642 @@
-import asyncio
-import logging
-import os
-import sys
-
-import discord
-import requests
-from discord import app_commands
-from discord.ext import commands
-from dotenv import load_dotenv
-
-# Setup logging
-logging.basicConfig(
-    level=logging.INFO,
-    format="%(asctime)s - %(name)s - %(levelname)s - %(message)s",
-    handlers=[
-        # Only log to console, not to file
-        logging.StreamHandler(sys.stdout)
-    ],
-)
-logger = logging.getLogger(__name__)
-
-# Load environment variables
-logger.debug("Loading environment variables from .env file")
-load_dotenv()
-
-# Get configuration values
-DISCORD_TOKEN = os.getenv("DISCORD_TOKEN")
-DISCORD_GUILD_ID = os.getenv("DISCORD_GUILD_ID")
-WEBHOOK_SERVER_URL = os.getenv("WEBHOOK_SERVER_URL")
-SECRET_TOKEN = os.getenv("SECRET_TOKEN")
-ADMIN_ROLE_ID = int(os.getenv("ADMIN_ROLE_ID")) if os.getenv("ADMIN_ROLE_ID") else None
-
-# Log configuration (without revealing sensitive information)
-logger.info("Configuration loaded:")
-logger.info("DISCORD_TOKEN: %s", "Set" if DISCORD_TOKEN else "Not set")
-logger.info("DISCORD_GUILD_ID: %s", DISCORD_GUILD_ID)
-logger.info("WEBHOOK_SERVER_URL: %s", WEBHOOK_SERVER_URL)
-logger.info("SECRET_TOKEN: %s", "Set" if SECRET_TOKEN else "Not set")
-logger.info("ADMIN_ROLE_ID: %s", ADMIN_ROLE_ID)
-
-# Initialize Discord client
-logger.debug("Initializing Discord client")
-intents = discord.Intents.default()
-client = commands.Bot(command_prefix="!", intents=intents)
-
-
-# Format code blocks for Discord
-def format_code_blocks(text):
-    """Format text into code blocks, splitting if necessary."""
-    logger.debug("Formatting text as code blocks")
-    if not text:
-        logger.debug("Empty text provided for formatting")
-        return ["No output"]
-
-    # If text is too long, split it
-    if len(text) > 1900:
-        logger.debug("Text exceeds 1900 characters, splitting into chunks")
-        chunks = []
-        for i in range(0, len(text), 1900):
-            chunks.append(f"```\n{text[i:i+1900]}\n```")
-        logger.debug("Split text into %d chunks", len(chunks))
-        return chunks
-
-    logger.debug("Returning single code block")
-    return [f"```\n{text}\n```"]
-
-
-# Check if user has admin role
-def has_admin_role(member):
-    """Check if a member has the admin role."""
-    logger.debug("Checking if user %s has admin role", member.name)
-
-    if not ADMIN_ROLE_ID:
-        logger.warning("ADMIN_ROLE_ID not set, denying access by default")
-        return False
-
-    has_role = discord.utils.get(member.roles, id=ADMIN_ROLE_ID) is not None
-    logger.debug("User %s admin role check result: %s", member.name, has_role)
-    return has_role
-
-
-@client.event
-async def on_ready():
-    """Called when the client is connected to Discord."""
-    logger.info("Bot is now logged in as %s (%s)", client.user.name, client.user.id)
-    logger.info("Connected to %d guilds", len(client.guilds))
-
-    for guild in client.guilds:
-        logger.debug("Connected to guild: %s (%s)", guild.name, guild.id)
-
-    await register_commands()
-
-
-async def register_commands():
-    """Register slash commands with Discord."""
-    logger.info("Registering slash commands")
-
-    try:
-        # Sync commands with Discord
-        if DISCORD_GUILD_ID:
-            guild = discord.Object(id=int(DISCORD_GUILD_ID))
-            logger.debug("Copying global commands to guild %s", DISCORD_GUILD_ID)
-            client.tree.copy_global_to(guild=guild)
-
-            logger.debug("Syncing commands with guild")
-            await client.tree.sync(guild=guild)
-            logger.info(
-                "Successfully registered slash commands to guild %s", DISCORD_GUILD_ID
-            )
-        else:
-            logger.debug("No guild ID specified, syncing commands globally")
-            await client.tree.sync()
-            logger.info("Successfully registered slash commands globally")
-    except Exception as e:
-        logger.error("Error registering slash commands: %s", str(e))
-        logger.exception("Detailed traceback:")
-
-
-@client.tree.command(name="mc", description="Execute a Minecraft server command")
-@app_commands.describe(command="The command to execute")
-async def mc_command(interaction: discord.Interaction, command: str):
-    """Execute a Minecraft server command."""
-    logger.info("User %s executed /mc command: %s", interaction.user.name, command)
-
-    # Check for admin role
-    if not has_admin_role(interaction.user):
-        logger.warning(
-            "User %s attempted to use /mc command without admin role",
-            interaction.user.name,
-        )
-        await interaction.response.send_message(
-            "❌ You need the Admin role to use this command", ephemeral=True
-        )
-        return
-
-    # Defer response since the command may take time to execute
-    logger.debug("Deferring response for /mc command")
-    await interaction.response.defer()
-
-    try:
-        logger.debug("Sending command to webhook server: %s", command)
-        headers = {"X-Secret-Token": SECRET_TOKEN}
-
-        logger.debug("Making POST request to %s/command", WEBHOOK_SERVER_URL)
-        response = requests.post(
-            f"{WEBHOOK_SERVER_URL}/command",
-            json={"command": command},
-            headers=headers,
-            timeout=10,
-        )
-
-        logger.debug("Received response with status code: %d", response.status_code)
-
-        if response.status_code == 200:
-            result = response.json().get("result", "No response")
-            logger.debug(
-                "Command result: %s",
-                result[:100] + "..." if len(result) > 100 else result,
-            )
-
-            formatted_results = format_code_blocks(result)
-            logger.debug("Formatted result into %d chunks", len(formatted_results))
-
-            # Send first chunk
-            logger.debug("Sending first chunk of response")
-            await interaction.followup.send(formatted_results[0])
-
-            # Send additional chunks if needed
-            for i, chunk in enumerate(formatted_results[1:], 1):
-                logger.debug("Sending additional chunk %d of response", i)
-                await interaction.followup.send(chunk)
-
-            logger.info(
-                "Successfully executed Minecraft command for %s", interaction.user.name
-            )
-        else:
-            error_data = response.json()
-            error_message = error_data.get("error", "Unknown error")
-            logger.error("Error response from webhook server: %s", error_message)
-            await interaction.followup.send(f"❌ Error: {error_message}")
-    except requests.ConnectionError as e:
-        logger.error("Connection error to webhook server: %s", str(e))
-        await interaction.followup.send(
-            f"❌ Error: Could not connect to Minecraft Terminal server. Please check if it's running."
-        )
-    except requests.Timeout as e:
-        logger.error("Timeout error when connecting to webhook server: %s", str(e))
-        await interaction.followup.send(
-            f"❌ Error: Connection to Minecraft Terminal server timed out."
-        )
-    except Exception as e:
-        logger.error("Error executing Minecraft command: %s", str(e))
-        logger.exception("Detailed traceback:")
-        await interaction.followup.send(f"❌ Error: {str(e)}")
-
-
-@client.tree.command(name="logs", description="Get recent Minecraft server logs")
-@app_commands.describe(lines="Number of log lines to retrieve (1-100)")
-async def logs_command(interaction: discord.Interaction, lines: int = 10):
-    """Get recent Minecraft server logs."""
-    logger.info(
-        "User %s executed /logs command for %d lines", interaction.user.name, lines
-    )
-
-    # Check for admin role
-    if not has_admin_role(interaction.user):
-        logger.warning(
-            "User %s attempted to use /logs command without admin role",
-            interaction.user.name,
-        )
-        await interaction.response.send_message(
-            "❌ You need the Admin role to use this command", ephemeral=True
-        )
-        return
-
-    # Validate input
-    if lines < 1 or lines > 100:
-        logger.warning(
-            "User %s provided invalid lines parameter: %d", interaction.user.name, lines
-        )
-        await interaction.response.send_message(
-            "❌ Please request between 1 and 100 lines", ephemeral=True
-        )
-        return
-
-    # Defer response since the logs may be large
-    logger.debug("Deferring response for /logs command")
-    await interaction.response.defer()
-
-    try:
-        logger.debug("Requesting %d log lines from webhook server", lines)
-        headers = {"X-Secret-Token": SECRET_TOKEN}
-
-        logger.debug("Making GET request to %s/logs", WEBHOOK_SERVER_URL)
-        response = requests.get(
-            f"{WEBHOOK_SERVER_URL}/logs",
-            params={"lines": lines},
-            headers=headers,
-            timeout=10,
-        )
-
-        logger.debug("Received response with status code: %d", response.status_code)
-
-        if response.status_code == 200:
-            logs = response.json().get("logs", "No logs available")
-            logger.debug("Retrieved log data of length: %d", len(logs))
-
-            formatted_logs = format_code_blocks(logs)
-            logger.debug("Formatted logs into %d chunks", len(formatted_logs))
-
-            # Send first chunk
-            logger.debug("Sending first chunk of logs")
-            await interaction.followup.send(formatted_logs[0])
-
-            # Send additional chunks if needed
-            for i, chunk in enumerate(formatted_logs[1:], 1):
-                logger.debug("Sending additional chunk %d of logs", i)
-                await interaction.followup.send(chunk)
-
-            logger.info("Successfully retrieved logs for %s", interaction.user.name)
-        else:
-            error_data = response.json()
-            error_message = error_data.get("error", "Unknown error")
-            logger.error("Error response from webhook server: %s", error_message)
-            await interaction.followup.send(f"❌ Error: {error_message}")
-    except requests.ConnectionError as e:
-        logger.error("Connection error to webhook server: %s", str(e))
-        await interaction.followup.send(
-            f"❌ Error: Could not connect to Minecraft Terminal server. Please check if it's running."
-        )
-    except requests.Timeout as e:
-        logger.error("Timeout error when connecting to webhook server: %s", str(e))
-        await interaction.followup.send(
-            f"❌ Error: Connection to Minecraft Terminal server timed out."
-        )
-    except Exception as e:
-        logger.error("Error retrieving logs: %s", str(e))
-        logger.exception("Detailed traceback:")
-        await interaction.followup.send(f"❌ Error: {str(e)}")
-
-
-@client.tree.command(name="status", description="Check Minecraft server status")
-async def status_command(interaction: discord.Interaction):
-    """Check Minecraft server status."""
-    logger.info("User %s executed /status command", interaction.user.name)
-
-    # Defer response
-    logger.debug("Deferring response for /status command")
-    await interaction.response.defer()
-
-    try:
-        logger.debug("Requesting status from webhook server")
-        headers = {"X-Secret-Token": SECRET_TOKEN}
-
-        logger.debug("Making GET request to %s/status", WEBHOOK_SERVER_URL)
-        response = requests.get(
-            f"{WEBHOOK_SERVER_URL}/status", headers=headers, timeout=10
-        )
-
-        logger.debug("Received response with status code: %d", response.status_code)
-
-        if response.status_code == 200:
-            status_data = response.json().get("status", {})
-            rcon_connected = status_data.get("rconConnected", False)
-            log_watcher_active = status_data.get("logWatcherActive", False)
-
-            logger.debug(
-                "Status received - RCON: %s, Log Watcher: %s",
-                rcon_connected,
-                log_watcher_active,
-            )
-
-            # Create embed
-            logger.debug("Creating Discord embed for status response")
-            embed = discord.Embed(
-                title="Minecraft Server Status",
-                color=discord.Color.green() if rcon_connected else discord.Color.red(),
-                timestamp=interaction.created_at,
-            )
-
-            embed.add_field(
-                name="RCON Connection",
-                value="✅ Connected" if rcon_connected else "❌ Disconnected",
-                inline=True,
-            )
-
-            embed.add_field(
-                name="Log Watcher",
-                value="✅ Active" if log_watcher_active else "❌ Inactive",
-                inline=True,
-            )
-
-            logger.debug("Sending status embed to Discord")
-            await interaction.followup.send(embed=embed)
-            logger.info(
-                "Successfully sent status information to %s", interaction.user.name
-            )
-        else:
-            error_data = response.json()
-            error_message = error_data.get("error", "Unknown error")
-            logger.error("Error response from webhook server: %s", error_message)
-            await interaction.followup.send(f"❌ Error: {error_message}")
-    except requests.ConnectionError as e:
-        logger.error("Connection error to webhook server: %s", str(e))
-        await interaction.followup.send(
-            f"❌ Error: Could not connect to Minecraft Terminal server. Please check if it's running."
-        )
-    except requests.Timeout as e:
-        logger.error("Timeout error when connecting to webhook server: %s", str(e))
-        await interaction.followup.send(
-            f"❌ Error: Connection to Minecraft Terminal server timed out."
-        )
-    except Exception as e:
-        logger.error("Error checking status: %s", str(e))
-        logger.exception("Detailed traceback:")
-        await interaction.followup.send(f"❌ Error: {str(e)}")
-
-
-if __name__ == "__main__":
-    logger.info("Starting Discord Integration for Minecraft Terminal")
-
-    # Check if required environment variables are set
-    missing_vars = []
-
-    if not DISCORD_TOKEN:
-        missing_vars.append("DISCORD_TOKEN")
-        logger.error("DISCORD_TOKEN is not set")
-
-    if not DISCORD_GUILD_ID:
-        missing_vars.append("DISCORD_GUILD_ID")
-        logger.error("DISCORD_GUILD_ID is not set")
-
-    if not WEBHOOK_SERVER_URL:
-        missing_vars.append("WEBHOOK_SERVER_URL")
-        logger.error("WEBHOOK_SERVER_URL is not set")
-
-    if not SECRET_TOKEN:
-        missing_vars.append("SECRET_TOKEN")
-        logger.error("SECRET_TOKEN is not set")
-
-    if not ADMIN_ROLE_ID:
-        missing_vars.append("ADMIN_ROLE_ID")
-        logger.error("ADMIN_ROLE_ID is not set")
-
-    if missing_vars:
-        logger.error(
-            "Required environment variables not set: %s", ", ".join(missing_vars)
-        )
-        logger.error("Please check your .env file")
-        sys.exit(1)
-
-    # Verify webhook server URL format
-    if WEBHOOK_SERVER_URL and not (
-        WEBHOOK_SERVER_URL.startswith("http://")
-        or WEBHOOK_SERVER_URL.startswith("https://")
-    ):
-        logger.warning(
-            "WEBHOOK_SERVER_URL does not start with http:// or https://, this may cause issues"
-        )
-        logger.warning("Current value: %s", WEBHOOK_SERVER_URL)
-
-    try:
-        # Start the bot
-        logger.info("Connecting to Discord...")
-        client.run(DISCORD_TOKEN)
-    except discord.LoginFailure:
-        logger.error("Failed to login to Discord - invalid token")
-    except Exception as e:
-        logger.error("Error starting Discord bot: %s", str(e))
-        logger.exception("Detailed traceback:")
+import asyncio
+import hashlib
+import io
+import json
+import logging
+import os
+import sys
+import time
+
+import aiohttp
+import discord
+from discord import app_commands
+from discord.ext import commands
+from dotenv import load_dotenv
+
+# uvloop is a drop-in, C-based event loop that is much faster than the
+# default selector loop; it is not available on Windows
+try:
+    import uvloop
+except ImportError:
+    uvloop = None
+
+# Skip collecting unused per-record attributes (thread/process names)
+logging.logThreads = False
+logging.logProcesses = False
+logging.logMultiprocessing = False
+
+
+class CachedTimeFormatter(logging.Formatter):
+    """Formatter that reuses the rendered timestamp within one second.
+
+    The default formatter calls strftime/localtime for every record;
+    under bursty logging most records share the same second, so cache
+    the rendered stamp and only append the per-record milliseconds.
+    """
+
+    _last_second = None
+    _last_stamp = ""
+
+    def formatTime(self, record, datefmt=None):
+        second = int(record.created)
+        if second != self._last_second:
+            self._last_second = second
+            self._last_stamp = time.strftime(
+                datefmt or self.default_time_format, self.converter(record.created)
+            )
+        if datefmt:
+            return self._last_stamp
+        return self.default_msec_format % (self._last_stamp, record.msecs)
+
+
+# Setup logging
+_log_handler = logging.StreamHandler(sys.stdout)  # only log to console, not to file
+_log_handler.setFormatter(
+    CachedTimeFormatter("%(asctime)s - %(name)s - %(levelname)s - %(message)s")
+)
+logging.basicConfig(level=logging.INFO, handlers=[_log_handler])
+logger = logging.getLogger(__name__)
+
+# Load environment variables
+logger.debug("Loading environment variables from .env file")
+load_dotenv()
+
+# Get configuration values
+DISCORD_TOKEN = os.getenv("DISCORD_TOKEN")
+DISCORD_GUILD_ID = (
+    int(os.getenv("DISCORD_GUILD_ID")) if os.getenv("DISCORD_GUILD_ID") else None
+)
+WEBHOOK_SERVER_URL = os.getenv("WEBHOOK_SERVER_URL")
+SECRET_TOKEN = os.getenv("SECRET_TOKEN")
+ADMIN_ROLE_ID = int(os.getenv("ADMIN_ROLE_ID")) if os.getenv("ADMIN_ROLE_ID") else None
+
+# Log configuration (without revealing sensitive information)
+logger.info("Configuration loaded:")
+logger.info("DISCORD_TOKEN: %s", "Set" if DISCORD_TOKEN else "Not set")
+logger.info("DISCORD_GUILD_ID: %s", DISCORD_GUILD_ID)
+logger.info("WEBHOOK_SERVER_URL: %s", WEBHOOK_SERVER_URL)
+logger.info("SECRET_TOKEN: %s", "Set" if SECRET_TOKEN else "Not set")
+logger.info("ADMIN_ROLE_ID: %s", ADMIN_ROLE_ID)
+
+# Endpoint URLs and auth header, built once at import time
+COMMAND_URL = f"{WEBHOOK_SERVER_URL}/command"
+LOGS_URL = f"{WEBHOOK_SERVER_URL}/logs"
+STATUS_URL = f"{WEBHOOK_SERVER_URL}/status"
+AUTH_HEADERS = {"X-Secret-Token": SECRET_TOKEN}
+
+# Static user-facing messages, allocated once
+MSG_NO_ADMIN = "❌ You need the Admin role to use this command"
+MSG_INVALID_LINES = "❌ Please request between 1 and 100 lines"
+MSG_CONN_ERR = (
+    "❌ Error: Could not connect to Minecraft Terminal server. "
+    "Please check if it's running."
+)
+MSG_TIMEOUT = "❌ Error: Connection to Minecraft Terminal server timed out."
+
+# Shared HTTP session for talking to the webhook server, created once the
+# event loop is running so commands never block the loop on network I/O
+http_session = None
+
+
+class MinecraftBot(commands.Bot):
+    """Bot subclass that owns the shared aiohttp client session."""
+
+    async def setup_hook(self):
+        """Create the shared HTTP session once the event loop is running."""
+        global http_session
+
+        # Let short coroutines (role checks, queued followup sends) complete
+        # without a round-trip through the scheduler (Python 3.12+)
+        if hasattr(asyncio, "eager_task_factory"):
+            logger.debug("Enabling asyncio eager task factory")
+            asyncio.get_running_loop().set_task_factory(asyncio.eager_task_factory)
+
+        logger.debug("Creating shared aiohttp client session")
+        http_session = aiohttp.ClientSession(
+            headers=AUTH_HEADERS,
+            timeout=aiohttp.ClientTimeout(total=10),
+            connector=aiohttp.TCPConnector(limit=20, keepalive_timeout=30),
+        )
+
+    async def close(self):
+        """Close the shared HTTP session before shutting the bot down."""
+        if http_session is not None and not http_session.closed:
+            logger.debug("Closing shared aiohttp client session")
+            await http_session.close()
+        await super().close()
+
+
+# Initialize Discord client
+logger.debug("Initializing Discord client")
+intents = discord.Intents.default()
+# Privileged intent: on_member_update only fires with it, and it is what
+# lets a role change evict the cached admin check immediately instead of
+# waiting out the TTL. Must also be enabled for the bot under
+# Privileged Gateway Intents in the Discord developer portal.
+intents.members = True
+client = MinecraftBot(command_prefix="!", intents=intents)
+
+
+# Discord messages cap at 2000 characters; leave room for the code fences
+MAX_BODY = 1900
+CODE_HEAD = "```\n"
+CODE_TAIL = "\n```"
+
+
+# Returned for empty payloads; shared between calls, so never mutate it
+_NO_OUTPUT = ["No output"]
+
+
+# Format code blocks for Discord
+def format_code_blocks(text, _head=CODE_HEAD, _tail=CODE_TAIL, _max=MAX_BODY):
+    """Format text into code blocks, splitting if necessary.
+
+    The fences and size budget are bound as default arguments so the
+    common single-block path only touches locals.
+    """
+    if not text:
+        return _NO_OUTPUT
+
+    n = len(text)
+    if n <= _max:
+        return [_head + text + _tail]
+
+    return [_head + text[i : i + _max] + _tail for i in range(0, n, _max)]
+
+
+def format_code_blocks_bytes(text, _head=CODE_HEAD, _tail=CODE_TAIL, _max=MAX_BODY):
+    """Format a large payload into code blocks by slicing its UTF-8 bytes.
+
+    Used for big log dumps where repeated str slicing dominates; chunk
+    boundaries are nudged back onto codepoint starts so no character is
+    split across blocks.
+    """
+    data = text.encode("utf-8")
+    n = len(data)
+    if n <= _max:
+        return format_code_blocks(text)
+
+    view = memoryview(data)
+    blocks = []
+    start = 0
+    while start < n:
+        end = min(start + _max, n)
+        # Back up past any UTF-8 continuation bytes at the boundary
+        while end < n and (data[end] & 0xC0) == 0x80:
+            end -= 1
+        blocks.append(_head + view[start:end].tobytes().decode("utf-8") + _tail)
+        start = end
+    return blocks
+
+
+# Throttle concurrent followup sends so chunk bursts do not trip Discord's
+# per-channel rate limit; past this many chunks, upload a file instead
+_followup_sem = asyncio.Semaphore(3)
+FILE_UPLOAD_THRESHOLD = 5
+
+
+async def send_chunks(interaction, text, chunks):
+    """Send formatted output chunks without tripping Discord rate limits.
+
+    Output spanning many chunks goes out as a single file attachment —
+    one API call instead of a burst of messages. Smaller multi-chunk
+    output is sent concurrently but gated through a semaphore.
+    """
+    # Bind the followup sender once; the chunk loop then only touches a
+    # local instead of resolving interaction.followup.send per chunk
+    send = interaction.followup.send
+
+    if len(chunks) > FILE_UPLOAD_THRESHOLD:
+        logger.debug("Output spans %d chunks, uploading as a file", len(chunks))
+        await send(
+            file=discord.File(io.BytesIO(text.encode("utf-8")), filename="output.txt")
+        )
+        return
+
+    # Send first chunk
+    logger.debug("Sending first chunk of output")
+    await send(chunks[0])
+
+    if len(chunks) > 1:
+
+        async def _send(chunk):
+            async with _followup_sem:
+                await send(chunk)
+
+        # Send remaining chunks concurrently to overlap the network
+        # round-trips; map builds the coroutines at C level
+        logger.debug("Sending %d additional chunks of output", len(chunks) - 1)
+        await asyncio.gather(*map(_send, chunks[1:]))
+
+
+async def fetch_and_send(interaction, request, response_key, default_msg, formatter):
+    """Run a webhook request and deliver its payload as code blocks.
+
+    Shared backend for /mc and /logs: performs the HTTP round-trip with
+    the try scoped to the network only, branches on status, formats the
+    payload with ``formatter``, and hands the chunks to send_chunks.
+    Returns the payload text on success, None on any handled failure.
+    """
+    try:
+        async with request as response:
+            status = response.status
+            logger.debug("Received response with status code: %d", status)
+
+            # Read the body once, then branch on status; content_type=None
+            # skips aiohttp's content-type check on the error path
+            payload = await response.json(content_type=None)
+    except aiohttp.ClientConnectionError as e:
+        logger.error("Connection error to webhook server: %s", str(e))
+        await interaction.followup.send(MSG_CONN_ERR)
+        return None
+    except asyncio.TimeoutError as e:
+        logger.error("Timeout error when connecting to webhook server: %s", str(e))
+        await interaction.followup.send(MSG_TIMEOUT)
+        return None
+    except Exception as e:
+        logger.error("Error talking to webhook server: %s", str(e))
+        logger.exception("Detailed traceback:")
+        await interaction.followup.send(f"❌ Error: {str(e)}")
+        return None
+
+    if status != 200:
+        error_message = payload.get("error", "Unknown error")
+        logger.error("Error response from webhook server: %s", error_message)
+        await interaction.followup.send(f"❌ Error: {error_message}")
+        return None
+
+    text = payload.get(response_key, default_msg)
+    # Only build the truncated preview when debug logging is on
+    if logger.isEnabledFor(logging.DEBUG):
+        logger.debug(
+            "Webhook %s payload: %s",
+            response_key,
+            text[:100] + "..." if len(text) > 100 else text,
+        )
+
+    chunks = formatter(text)
+    logger.debug("Formatted %s into %d chunks", response_key, len(chunks))
+
+    await send_chunks(interaction, text, chunks)
+    return text
+
+
+# Cache admin-role checks per user so repeat commands skip rescanning the
+# member's role list; entries expire after a short TTL
+ADMIN_CACHE_TTL = 60.0
+_admin_cache = {}
+
+
+# Check if user has admin role
+def has_admin_role(member):
+    """Check if a member has the admin role."""
+    logger.debug("Checking if user %s has admin role", member.name)
+
+    if not ADMIN_ROLE_ID:
+        logger.warning("ADMIN_ROLE_ID not set, denying access by default")
+        return False
+
+    now = time.monotonic()
+    cached = _admin_cache.get(member.id)
+    if cached and now - cached[0] < ADMIN_CACHE_TTL:
+        logger.debug("User %s admin role check cached: %s", member.name, cached[1])
+        return cached[1]
+
+    has_role = ADMIN_ROLE_ID in {role.id for role in member.roles}
+    _admin_cache[member.id] = (now, has_role)
+    logger.debug("User %s admin role check result: %s", member.name, has_role)
+    return has_role
+
+
+@client.event
+async def on_ready():
+    """Called when the client is connected to Discord."""
+    logger.info("Bot is now logged in as %s (%s)", client.user.name, client.user.id)
+    logger.info("Connected to %d guilds", len(client.guilds))
+
+    for guild in client.guilds:
+        logger.debug("Connected to guild: %s (%s)", guild.name, guild.id)
+
+    await register_commands()
+
+
+@client.event
+async def on_member_update(before, after):
+    """Invalidate the cached admin check when a member's roles change."""
+    if before.roles != after.roles:
+        logger.debug("Roles changed for %s, clearing cached admin check", after.name)
+        _admin_cache.pop(after.id, None)
+
+
+# Guild object reused across reconnects instead of rebuilding per on_ready
+_GUILD_OBJ = discord.Object(id=DISCORD_GUILD_ID) if DISCORD_GUILD_ID else None
+
+# Last synced command signature is persisted here so reconnects (and
+# restarts) skip the sync round-trip when commands have not changed
+COMMAND_HASH_FILE = ".command_hash"
+
+
+def get_command_signature():
+    """Build a stable hash of the registered command tree."""
+    commands_repr = sorted(
+        (cmd.name, cmd.description, str(getattr(cmd, "parameters", "")))
+        for cmd in client.tree.get_commands()
+    )
+    return hashlib.sha256(json.dumps(commands_repr).encode("utf-8")).hexdigest()
+
+
+async def register_commands():
+    """Register slash commands with Discord."""
+    logger.info("Registering slash commands")
+
+    try:
+        signature = get_command_signature()
+        try:
+            with open(COMMAND_HASH_FILE, "r", encoding="utf-8") as f:
+                last_signature = f.read().strip()
+        except OSError:
+            last_signature = None
+
+        if signature == last_signature:
+            logger.info("Command signature unchanged, skipping sync")
+            return
+
+        # Sync commands with Discord
+        if DISCORD_GUILD_ID:
+            logger.debug("Copying global commands to guild %s", DISCORD_GUILD_ID)
+            client.tree.copy_global_to(guild=_GUILD_OBJ)
+
+            logger.debug("Syncing commands with guild")
+            await client.tree.sync(guild=_GUILD_OBJ)
+            logger.info(
+                "Successfully registered slash commands to guild %s", DISCORD_GUILD_ID
+            )
+        else:
+            logger.debug("No guild ID specified, syncing commands globally")
+            await client.tree.sync()
+            logger.info("Successfully registered slash commands globally")
+
+        with open(COMMAND_HASH_FILE, "w", encoding="utf-8") as f:
+            f.write(signature)
+    except Exception as e:
+        logger.error("Error registering slash commands: %s", str(e))
+        logger.exception("Detailed traceback:")
+
+
+@client.tree.command(name="mc", description="Execute a Minecraft server command")
+@app_commands.describe(command="The command to execute")
+async def mc_command(interaction: discord.Interaction, command: str):
+    """Execute a Minecraft server command."""
+    logger.info("User %s executed /mc command: %s", interaction.user.name, command)
+
+    # Check for admin role
+    if not has_admin_role(interaction.user):
+        logger.warning(
+            "User %s attempted to use /mc command without admin role",
+            interaction.user.name,
+        )
+        await interaction.response.send_message(MSG_NO_ADMIN, ephemeral=True)
+        return
+
+    # Defer response since the command may take time to execute
+    logger.debug("Deferring response for /mc command")
+    await interaction.response.defer()
+
+    logger.debug("Sending command to webhook server: %s", command)
+    logger.debug("Making POST request to %s", COMMAND_URL)
+    result = await fetch_and_send(
+        interaction,
+        http_session.post(COMMAND_URL, json={"command": command}),
+        "result",
+        "No response",
+        format_code_blocks,
+    )
+
+    if result is not None:
+        logger.info(
+            "Successfully executed Minecraft command for %s", interaction.user.name
+        )
+
+
+@client.tree.command(name="logs", description="Get recent Minecraft server logs")
+@app_commands.describe(lines="Number of log lines to retrieve (1-100)")
+async def logs_command(interaction: discord.Interaction, lines: int = 10):
+    """Get recent Minecraft server logs."""
+    logger.info(
+        "User %s executed /logs command for %d lines", interaction.user.name, lines
+    )
+
+    # Check for admin role
+    if not has_admin_role(interaction.user):
+        logger.warning(
+            "User %s attempted to use /logs command without admin role",
+            interaction.user.name,
+        )
+        await interaction.response.send_message(MSG_NO_ADMIN, ephemeral=True)
+        return
+
+    # Validate input
+    if lines < 1 or lines > 100:
+        logger.warning(
+            "User %s provided invalid lines parameter: %d", interaction.user.name, lines
+        )
+        await interaction.response.send_message(MSG_INVALID_LINES, ephemeral=True)
+        return
+
+    # Defer response since the logs may be large
+    logger.debug("Deferring response for /logs command")
+    await interaction.response.defer()
+
+    logger.debug("Requesting %d log lines from webhook server", lines)
+    logger.debug("Making GET request to %s", LOGS_URL)
+    logs = await fetch_and_send(
+        interaction,
+        http_session.get(LOGS_URL, params={"lines": lines}),
+        "logs",
+        "No logs available",
+        format_code_blocks_bytes,
+    )
+
+    if logs is not None:
+        logger.info("Successfully retrieved logs for %s", interaction.user.name)
+
+
+# Cache /status results briefly so bursts of /status calls share a single
+# webhook round-trip; the lock coalesces concurrent refreshes
+STATUS_CACHE_TTL = 3.0
+_status_cache = None
+_status_lock = asyncio.Lock()
+
+# Pre-baked embed field values so each render skips building the strings
+MSG_RCON_UP = "✅ Connected"
+MSG_RCON_DOWN = "❌ Disconnected"
+MSG_WATCHER_UP = "✅ Active"
+MSG_WATCHER_DOWN = "❌ Inactive"
+
+
+def build_status_embed_dict(status_data):
+    """Build the /status embed template, minus the per-call timestamp."""
+    rcon_connected = status_data.get("rconConnected", False)
+    log_watcher_active = status_data.get("logWatcherActive", False)
+
+    embed = discord.Embed(
+        title="Minecraft Server Status",
+        color=discord.Color.green() if rcon_connected else discord.Color.red(),
+    )
+
+    embed.add_field(
+        name="RCON Connection",
+        value=MSG_RCON_UP if rcon_connected else MSG_RCON_DOWN,
+        inline=True,
+    )
+
+    embed.add_field(
+        name="Log Watcher",
+        value=MSG_WATCHER_UP if log_watcher_active else MSG_WATCHER_DOWN,
+        inline=True,
+    )
+
+    return embed.to_dict()
+
+
+async def get_server_status():
+    """Fetch the server status, reusing a recent cached result.
+
+    Returns (status dict, embed template dict, error string); the error
+    is None on success. Only one refresh is in flight at a time; callers
+    arriving within the TTL reuse the cached payload and embed template
+    without touching the network.
+    """
+    global _status_cache
+
+    async with _status_lock:
+        now = time.monotonic()
+        if _status_cache and now - _status_cache[0] < STATUS_CACHE_TTL:
+            logger.debug("Serving status from cache")
+            return _status_cache[1], _status_cache[2], None
+
+        logger.debug("Making GET request to %s", STATUS_URL)
+        async with http_session.get(STATUS_URL) as response:
+            logger.debug("Received response with status code: %d", response.status)
+
+            # Read the body once, then branch on status; content_type=None
+            # skips aiohttp's content-type check on the error path
+            payload = await response.json(content_type=None)
+
+            if response.status != 200:
+                return None, None, payload.get("error", "Unknown error")
+
+            status_data = payload.get("status", {})
+            embed_dict = build_status_embed_dict(status_data)
+            _status_cache = (now, status_data, embed_dict)
+            return status_data, embed_dict, None
+
+
+@client.tree.command(name="status", description="Check Minecraft server status")
+async def status_command(interaction: discord.Interaction):
+    """Check Minecraft server status."""
+    logger.info("User %s executed /status command", interaction.user.name)
+
+    # Defer response
+    logger.debug("Deferring response for /status command")
+    await interaction.response.defer()
+
+    # Keep the try scoped to the network round-trip only; embed building
+    # and the final send run outside any exception handler
+    try:
+        logger.debug("Requesting status from webhook server")
+        status_data, embed_dict, error_message = await get_server_status()
+    except aiohttp.ClientConnectionError as e:
+        logger.error("Connection error to webhook server: %s", str(e))
+        await interaction.followup.send(MSG_CONN_ERR)
+        return
+    except asyncio.TimeoutError as e:
+        logger.error("Timeout error when connecting to webhook server: %s", str(e))
+        await interaction.followup.send(MSG_TIMEOUT)
+        return
+    except Exception as e:
+        logger.error("Error checking status: %s", str(e))
+        logger.exception("Detailed traceback:")
+        await interaction.followup.send(f"❌ Error: {str(e)}")
+        return
+
+    if status_data is None:
+        logger.error("Error response from webhook server: %s", error_message)
+        await interaction.followup.send(f"❌ Error: {error_message}")
+        return
+
+    logger.debug(
+        "Status received - RCON: %s, Log Watcher: %s",
+        status_data.get("rconConnected", False),
+        status_data.get("logWatcherActive", False),
+    )
+
+    # Rehydrate the cached template and stamp this interaction's time
+    logger.debug("Creating Discord embed for status response")
+    embed = discord.Embed.from_dict(embed_dict)
+    embed.timestamp = interaction.created_at
+
+    logger.debug("Sending status embed to Discord")
+    await interaction.followup.send(embed=embed)
+    logger.info("Successfully sent status information to %s", interaction.user.name)
+
+
+if __name__ == "__main__":
+    logger.info("Starting Discord Integration for Minecraft Terminal")
+
+    # Check if required environment variables are set
+    missing_vars = []
+
+    if not DISCORD_TOKEN:
+        missing_vars.append("DISCORD_TOKEN")
+        logger.error("DISCORD_TOKEN is not set")
+
+    if not DISCORD_GUILD_ID:
+        missing_vars.append("DISCORD_GUILD_ID")
+        logger.error("DISCORD_GUILD_ID is not set")
+
+    if not WEBHOOK_SERVER_URL:
+        missing_vars.append("WEBHOOK_SERVER_URL")
+        logger.error("WEBHOOK_SERVER_URL is not set")
+
+    if not SECRET_TOKEN:
+        missing_vars.append("SECRET_TOKEN")
+        logger.error("SECRET_TOKEN is not set")
+
+    if not ADMIN_ROLE_ID:
+        missing_vars.append("ADMIN_ROLE_ID")
+        logger.error("ADMIN_ROLE_ID is not set")
+
+    if missing_vars:
+        logger.error(
+            "Required environment variables not set: %s", ", ".join(missing_vars)
+        )
+        logger.error("Please check your .env file")
+        sys.exit(1)
+
+    # Verify webhook server URL format
+    if WEBHOOK_SERVER_URL and not (
+        WEBHOOK_SERVER_URL.startswith("http://")
+        or WEBHOOK_SERVER_URL.startswith("https://")
+    ):
+        logger.warning(
+            "WEBHOOK_SERVER_URL does not start with http:// or https://, this may cause issues"
+        )
+        logger.warning("Current value: %s", WEBHOOK_SERVER_URL)
+
+    # Use uvloop for the event loop when available
+    if uvloop is not None:
+        logger.info("Installing uvloop event loop policy")
+        uvloop.install()
+    else:
+        logger.debug("uvloop not available, using the default asyncio event loop")
+
+    try:
+        # Start the bot
+        logger.info("Connecting to Discord...")
+        client.run(DISCORD_TOKEN)
+    except discord.LoginFailure:
+        logger.error("Failed to login to Discord - invalid token")
+    except Exception as e:
+        logger.error("Error starting Discord bot: %s", str(e))
+        logger.exception("Detailed traceback:")
@@ -1,523 +1,1013 @@
-import logging
-import os
-import re
-import sys
-
-from discord_webhook import DiscordEmbed, DiscordWebhook
-from dotenv import load_dotenv
-from flask import Flask, jsonify, request
-from mcrcon import MCRcon
-from watchdog.events import FileSystemEventHandler
-from watchdog.observers import Observer
-
-# Setup logging with more detailed configuration
-logging.basicConfig(
-    level=logging.INFO,
-    format="%(asctime)s - %(name)s - %(levelname)s - %(message)s",
-    handlers=[
-        # Only log to console, not to file
-        logging.StreamHandler(sys.stdout)
-    ],
-)
-logger = logging.getLogger(__name__)
-
-# Load environment variables
-logger.debug("Loading environment variables from .env file")
-load_dotenv()
-
-# Get environment variables with appropriate logging
-MINECRAFT_SERVER_IP = os.getenv("MINECRAFT_SERVER_IP", "localhost")
-MINECRAFT_RCON_PORT = int(os.getenv("MINECRAFT_RCON_PORT", 25585))
-MINECRAFT_RCON_PASSWORD = os.getenv("MINECRAFT_RCON_PASSWORD")
-DISCORD_WEBHOOK_URL = os.getenv("DISCORD_WEBHOOK_URL")
-LOG_FILE_PATH = os.getenv("LOG_FILE_PATH")
-SECRET_TOKEN = os.getenv("SECRET_TOKEN")
-SERVER_PORT = int(os.getenv("SERVER_PORT", 25575))
-
-# Log configuration details (omitting sensitive information)
-logger.info("Configuration loaded:")
-logger.info("MINECRAFT_SERVER_IP: %s", MINECRAFT_SERVER_IP)
-logger.info("MINECRAFT_RCON_PORT: %s", MINECRAFT_RCON_PORT)
-logger.info("RCON Password: %s", "Set" if MINECRAFT_RCON_PASSWORD else "Not set")
-logger.info("Discord Webhook: %s", "Set" if DISCORD_WEBHOOK_URL else "Not set")
-logger.info("Log File Path: %s", LOG_FILE_PATH)
-logger.info("Secret Token: %s", "Set" if SECRET_TOKEN else "Not set")
-logger.info("Server Port: %s", SERVER_PORT)
-
-# Initialize the Flask app
-logger.debug("Initializing Flask application")
-app = Flask(__name__)
-
-# Global variables
-rcon_connected = False
-last_log_position = 0
-
-# Important log patterns
-logger.debug("Compiling log pattern regular expressions")
-IMPORTANT_PATTERNS = [
-    r"joined the game",
-    r"left the game",
-    r"Starting minecraft server",
-    r"Stopping server",
-    r"\[ERROR\]",
-    r"SEVERE",
-    r"was slain by",
-    r"was killed by",
-    r"Can't keep up!",
-    r"issued server command",
-]
-
-# Compile regex patterns for efficiency
-IMPORTANT_REGEX = [re.compile(pattern, re.IGNORECASE) for pattern in IMPORTANT_PATTERNS]
-
-
-def is_important_log(line):
-    """Check if a log line matches any important patterns."""
-    logger.debug(
-        "Checking if log line is important: %s",
-        line[:50] + "..." if len(line) > 50 else line,
-    )
-    return any(pattern.search(line) for pattern in IMPORTANT_REGEX)
-
-
-class MinecraftRCON:
-    """Class to handle RCON connections to the Minecraft server."""
-
-    def __init__(self, host, port, password):
-        logger.debug("Initializing MinecraftRCON with host: %s, port: %s", host, port)
-        self.host = host
-        self.port = port
-        self.password = password
-        self.rcon = None
-
-    def connect(self):
-        """Connect to the Minecraft server via RCON."""
-        global rcon_connected
-        logger.info("Attempting to connect to RCON at %s:%s", self.host, self.port)
-
-        try:
-            logger.debug("Creating MCRcon instance")
-            self.rcon = MCRcon(self.host, self.password, self.port)
-
-            logger.debug("Establishing RCON connection")
-            self.rcon.connect()
-
-            # Test the connection with a simple command
-            logger.debug("Testing RCON connection with 'list' command")
-            test_response = self.rcon.command("list")
-            logger.info("RCON test response: %s", test_response)
-
-            rcon_connected = True
-            logger.info("Successfully connected to Minecraft RCON")
-            send_webhook_message("✅ Connected to Minecraft server RCON")
-            return True
-        except ConnectionRefusedError as e:
-            rcon_connected = False
-            logger.error("RCON connection refused: %s", str(e))
-            logger.error(
-                "Check if the Minecraft server is running and RCON is properly configured"
-            )
-            send_webhook_message(
-                "❌ RCON connection refused. Is the Minecraft server running?"
-            )
-            return False
-        except Exception as e:
-            rcon_connected = False
-            logger.error("RCON connection error: %s", str(e))
-
-            # More detailed error logging for debugging
-            error_type = type(e).__name__
-            logger.error("Error type: %s", error_type)
-
-            if "unpack requires a buffer of 8 bytes" in str(e):
-                logger.error(
-                    "This error often occurs due to connection issues or wrong credentials"
-                )
-                logger.error(
-                    "Connection details - Host: %s, Port: %s, Password length: %d",
-                    self.host,
-                    self.port,
-                    len(self.password),
-                )
-
-            send_webhook_message(f"❌ RCON connection error: {str(e)}")
-            return False
-
-    def disconnect(self):
-        """Disconnect from the Minecraft server."""
-        global rcon_connected
-        logger.info("Disconnecting from Minecraft RCON")
-        try:
-            if self.rcon:
-                self.rcon.disconnect()
-                rcon_connected = False
-                logger.info("Successfully disconnected from Minecraft RCON")
-            else:
-                logger.warning("Disconnect called but RCON was not connected")
-        except Exception as e:
-            logger.error("Error disconnecting from RCON: %s", str(e))
-
-    def command(self, cmd):
-        """Execute a command on the Minecraft server."""
-        logger.info("Executing Minecraft command: %s", cmd)
-        try:
-            if not rcon_connected:
-                logger.warning(
-                    "Attempted to execute command while disconnected from RCON"
-                )
-                return "Not connected to Minecraft server"
-
-            logger.debug("Sending command via RCON")
-            response = self.rcon.command(cmd)
-            logger.debug("Command response: %s", response)
-            return response
-        except ConnectionResetError as e:
-            logger.error("Connection reset while executing command: %s", str(e))
-            logger.info("Attempting to reconnect to RCON")
-            self.disconnect()
-            if self.connect():
-                try:
-                    logger.info("Reconnected, retrying command: %s", cmd)
-                    response = self.rcon.command(cmd)
-                    logger.debug("Command response after reconnect: %s", response)
-                    return response
-                except Exception as e2:
-                    logger.error("Error executing command after reconnect: %s", str(e2))
-                    return f"Error: {str(e2)}"
-            return f"Error: Connection lost and reconnection failed"
-        except Exception as e:
-            logger.error("Error executing command: %s", str(e))
-            return f"Error: {str(e)}"
-
-
-class LogWatcher(FileSystemEventHandler):
-    """Watch the Minecraft log file for changes."""
-
-    def __init__(self, file_path):
-        logger.debug("Initializing LogWatcher for file: %s", file_path)
-        self.file_path = file_path
-        global last_log_position
-
-        # Initialize the log position
-        try:
-            if os.path.exists(file_path):
-                last_log_position = os.path.getsize(file_path)
-                logger.info(
-                    "Initialized log watcher at position %d bytes", last_log_position
-                )
-            else:
-                logger.error("Log file not found: %s", file_path)
-                send_webhook_message(f"❌ Log file not found: {file_path}")
-        except Exception as e:
-            logger.error("Error initializing log watcher: %s", str(e))
-
-    def on_modified(self, event):
-        """Handle log file modification events."""
-        if event.src_path == self.file_path:
-            logger.debug("Log file modified, processing new entries")
-            self.process_new_log_entries()
-        else:
-            logger.debug(
-                "File modified but not the target log file: %s", event.src_path
-            )
-
-    def process_new_log_entries(self):
-        """Process new entries in the log file."""
-        global last_log_position
-
-        try:
-            current_size = os.path.getsize(self.file_path)
-            logger.debug(
-                "Log file current size: %d bytes, last position: %d bytes",
-                current_size,
-                last_log_position,
-            )
-
-            # Check if the log has been rotated
-            if current_size < last_log_position:
-                logger.info("Log file appears to have been rotated, resetting position")
-                last_log_position = 0
-
-            # Only process if there's new content
-            if current_size > last_log_position:
-                logger.debug(
-                    "Reading %d new bytes from log file",
-                    current_size - last_log_position,
-                )
-                with open(self.file_path, "r", encoding="utf-8") as file:
-                    file.seek(last_log_position)
-                    new_content = file.read()
-
-                # Update the position
-                last_log_position = current_size
-                logger.debug("Updated last_log_position to %d", last_log_position)
-
-                # Process new log lines
-                lines = new_content.splitlines()
-                logger.debug("Processing %d new log lines", len(lines))
-
-                important_count = 0
-                for line in lines:
-                    if line and is_important_log(line):
-                        logger.debug(
-                            "Found important log entry: %s",
-                            line[:50] + "..." if len(line) > 50 else line,
-                        )
-                        send_webhook_message(f"```{line}```")
-                        important_count += 1
-
-                if important_count > 0:
-                    logger.info(
-                        "Sent %d important log entries to Discord", important_count
-                    )
-                else:
-                    logger.debug("No important log entries found in new content")
-
-        except Exception as e:
-            logger.error("Error processing log file: %s", str(e))
-            logger.exception("Detailed traceback:")
-
-
-def send_webhook_message(content, embed=None):
-    """Send a message to the Discord webhook."""
-    if not DISCORD_WEBHOOK_URL:
-        logger.warning(
-            "Attempted to send webhook message but DISCORD_WEBHOOK_URL is not set"
-        )
-        return
-
-    logger.debug(
-        "Sending Discord webhook message: %s",
-        content[:50] + "..." if len(content) > 50 else content,
-    )
-    try:
-        webhook = DiscordWebhook(
-            url=DISCORD_WEBHOOK_URL,
-            username="Minecraft Server Terminal",
-            avatar_url="https://www.minecraft.net/etc.clientlibs/minecraft/clientlibs/main/resources/img/minecraft-logo.png",
-            content=content,
-        )
-
-        if embed:
-            logger.debug("Adding embed to webhook message")
-            webhook.add_embed(embed)
-
-        response = webhook.execute()
-        if response.status_code == 204:
-            logger.debug("Webhook message sent successfully")
-        else:
-            logger.warning(
-                "Webhook returned unexpected status code: %d", response.status_code
-            )
-    except Exception as e:
-        logger.error("Error sending webhook message: %s", str(e))
-
-
-def get_recent_logs(lines=10):
-    """Get the most recent lines from the log file."""
-    logger.info("Retrieving %d recent log lines", lines)
-    try:
-        if not os.path.exists(LOG_FILE_PATH):
-            logger.error("Log file not found: %s", LOG_FILE_PATH)
-            return f"Log file not found: {LOG_FILE_PATH}"
-
-        logger.debug("Reading log file: %s", LOG_FILE_PATH)
-        with open(LOG_FILE_PATH, "r", encoding="utf-8") as file:
-            log_lines = file.readlines()
-
-        # Get the last N lines
-        result = "".join(log_lines[-lines:])
-        logger.debug("Retrieved %d lines from log file", min(lines, len(log_lines)))
-        return result
-    except Exception as e:
-        logger.error("Error getting recent logs: %s", str(e))
-        return f"Error reading logs: {str(e)}"
-
-
-# API authentication middleware
-def verify_token():
-    """Verify the secret token in the request header."""
-    token = request.headers.get("X-Secret-Token")
-    result = token == SECRET_TOKEN
-    if not result:
-        logger.warning("API request with invalid token received")
-    return result
-
-
-# Flask routes
-@app.route("/command", methods=["POST"])
-def handle_command():
-    """Handle command execution requests."""
-    logger.info("Received command execution request")
-
-    if not verify_token():
-        logger.warning("Unauthorized command request rejected")
-        return jsonify({"error": "Unauthorized"}), 401
-
-    data = request.json
-    if not data or "command" not in data:
-        logger.warning("Received command request without 'command' field")
-        return jsonify({"error": "Command is required"}), 400
-
-    command = data["command"]
-    logger.info("Executing command: %s", command)
-    result = minecraft_rcon.command(command)
-
-    logger.debug("Command result: %s", result)
-    return jsonify(
-        {"success": True, "result": result or "Command executed (no response)"}
-    )
-
-
-@app.route("/logs", methods=["GET"])
-def handle_logs():
-    """Handle log retrieval requests."""
-    logger.info("Received logs request")
-
-    if not verify_token():
-        logger.warning("Unauthorized logs request rejected")
-        return jsonify({"error": "Unauthorized"}), 401
-
-    try:
-        lines = int(request.args.get("lines", 10))
-        logger.info("Retrieving %d log lines", lines)
-
-        if lines < 1 or lines > 100:
-            logger.warning("Invalid log lines parameter: %d", lines)
-            return jsonify({"error": "Please request between 1 and 100 lines"}), 400
-
-        logs = get_recent_logs(lines)
-        return jsonify({"success": True, "logs": logs})
-    except ValueError as e:
-        logger.error("Invalid lines parameter: %s", str(e))
-        return jsonify({"error": "Invalid lines parameter"}), 400
-
-
-@app.route("/status", methods=["GET"])
-def handle_status():
-    """Handle status check requests."""
-    logger.info("Received status request")
-
-    if not verify_token():
-        logger.warning("Unauthorized status request rejected")
-        return jsonify({"error": "Unauthorized"}), 401
-
-    status = {
-        "success": True,
-        "status": {
-            "rconConnected": rcon_connected,
-            "logWatcherActive": (
-                os.path.exists(LOG_FILE_PATH) if LOG_FILE_PATH else False
-            ),
-        },
-    }
-
-    logger.debug("Status response: %s", status)
-    return jsonify(status)
-
-
-def start_log_watcher():
-    """Start watching the log file for changes."""
-    if not LOG_FILE_PATH:
-        logger.error("LOG_FILE_PATH not set, cannot start log watcher")
-        return None
-
-    logger.info("Starting log watcher for: %s", LOG_FILE_PATH)
-
-    if not os.path.exists(LOG_FILE_PATH):
-        logger.error("Log file not found: %s", LOG_FILE_PATH)
-        send_webhook_message(f"❌ Log file not found: {LOG_FILE_PATH}")
-        return None
-
-    try:
-        log_dir = os.path.dirname(LOG_FILE_PATH)
-        logger.debug("Setting up log watcher in directory: %s", log_dir)
-
-        event_handler = LogWatcher(LOG_FILE_PATH)
-        observer = Observer()
-        observer.schedule(event_handler, log_dir, recursive=False)
-        observer.start()
-
-        logger.info("Log watcher started successfully")
-        return observer
-    except Exception as e:
-        logger.error("Failed to start log watcher: %s", str(e))
-        logger.exception("Detailed traceback:")
-        return None
-
-
-if __name__ == "__main__":
-    logger.info("Starting Minecraft Server Terminal")
-
-    # Check if required environment variables are set
-    missing_vars = []
-
-    if not MINECRAFT_RCON_PASSWORD:
-        missing_vars.append("MINECRAFT_RCON_PASSWORD")
-        logger.error("MINECRAFT_RCON_PASSWORD is not set")
-
-    if not DISCORD_WEBHOOK_URL:
-        missing_vars.append("DISCORD_WEBHOOK_URL")
-        logger.error("DISCORD_WEBHOOK_URL is not set")
-
-    if not SECRET_TOKEN:
-        missing_vars.append("SECRET_TOKEN")
-        logger.error("SECRET_TOKEN is not set")
-
-    if missing_vars:
-        logger.error(
-            "Required environment variables not set: %s", ", ".join(missing_vars)
-        )
-        logger.error("Please check your .env file")
-        sys.exit(1)
-
-    # Initialize RCON connection
-    logger.info("Initializing RCON connection to Minecraft server")
-    minecraft_rcon = MinecraftRCON("141.148.217.100", 25585, "iamyourfather")
-
-    # Connect to Minecraft server
-    connection_result = minecraft_rcon.connect()
-    if not connection_result:
-        logger.warning("Failed to connect to Minecraft server on startup")
-        logger.info("Continuing anyway - will retry on command execution")
-
-    # Start log watcher
-    observer = None
-    if LOG_FILE_PATH:
-        observer = start_log_watcher()
-        if not observer:
-            logger.warning("Log watcher failed to start")
-    else:
-        logger.warning("LOG_FILE_PATH not set, log watching is disabled")
-
-    try:
-        # Send startup notification
-        logger.info("Sending startup notification to Discord")
-        send_webhook_message("🚀 Minecraft Server Terminal is now online")
-
-        # Start the Flask server
-        logger.info("Starting Flask server on port %d", SERVER_PORT)
-        app.run(host="0.0.0.0", port=SERVER_PORT)
-
-    except KeyboardInterrupt:
-        logger.info("Received keyboard interrupt, shutting down...")
-    except Exception as e:
-        logger.error("Error during server operation: %s", str(e))
-        logger.exception("Detailed traceback:")
-    finally:
-        logger.info("Performing cleanup tasks")
-
-        # Disconnect RCON
-        logger.info("Disconnecting from RCON")
-        minecraft_rcon.disconnect()
-
-        # Stop log watcher
-        if observer:
-            logger.info("Stopping log watcher")
-            observer.stop()
-            observer.join()
-
-        logger.info("Sending shutdown notification to Discord")
-        send_webhook_message("⚠️ Minecraft Server Terminal is shutting down")
-
-        logger.info("Shutdown complete")
+import collections
+import functools
+import gzip
+import hmac
+import logging
+import mmap
+import os
+import queue
+import re
+import socket
+import sys
+import threading
+import time
+from dataclasses import dataclass, field
+from pathlib import Path
+
+import requests
+from discord_webhook import DiscordEmbed, DiscordWebhook
+from dotenv import load_dotenv
+from flask import Flask, Response, jsonify, request
+from mcrcon import MCRcon
+from watchdog.events import PatternMatchingEventHandler
+from watchdog.observers import Observer
+
+# Use the inotify observer directly on Linux; other platforms fall back
+# to watchdog's default selection
+try:
+    from watchdog.observers.inotify import InotifyObserver
+except ImportError:
+    InotifyObserver = None
+
+# orjson serializes large payloads (the /logs text in particular) much
+# faster than the stdlib encoder; fall back to jsonify without it
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# waitress is a threaded production WSGI server; fall back to Flask's
+# single-threaded dev server when it is not installed
+try:
+    from waitress import serve as waitress_serve
+except ImportError:
+    waitress_serve = None
+
+# pyahocorasick matches every literal pattern in one pass over the line;
+# fall back to substring needle checks when it is not installed
+try:
+    import ahocorasick
+except ImportError:
+    ahocorasick = None
+
+# Setup logging; the format omits %(name)s since this is a single-module
+# process, which shaves per-record formatting cost on the busy logger
+logging.basicConfig(
+    level=logging.INFO,
+    format="%(asctime)s - %(levelname)s - %(message)s",
+    handlers=[
+        # Only log to console, not to file
+        logging.StreamHandler(sys.stdout)
+    ],
+    force=True,
+)
+logger = logging.getLogger(__name__)
+
+# Load environment variables; the explicit path skips python-dotenv's
+# directory walk, anchored to the module so any launch directory works
+load_dotenv(dotenv_path=Path(__file__).with_name(".env"), override=False)
+
+# Get environment variables with appropriate logging
+MINECRAFT_SERVER_IP = os.getenv("MINECRAFT_SERVER_IP", "localhost")
+MINECRAFT_RCON_PORT = int(os.getenv("MINECRAFT_RCON_PORT", 25585))
+MINECRAFT_RCON_PASSWORD = os.getenv("MINECRAFT_RCON_PASSWORD")
+DISCORD_WEBHOOK_URL = os.getenv("DISCORD_WEBHOOK_URL")
+LOG_FILE_PATH = os.getenv("LOG_FILE_PATH")
+SECRET_TOKEN = os.getenv("SECRET_TOKEN")
+SERVER_PORT = int(os.getenv("SERVER_PORT", 25575))
+
+# Log configuration details in one record (omitting sensitive values)
+logger.info(
+    "Configuration loaded: %s",
+    {
+        "server_ip": MINECRAFT_SERVER_IP,
+        "rcon_port": MINECRAFT_RCON_PORT,
+        "rcon_password": "set" if MINECRAFT_RCON_PASSWORD else "not set",
+        "webhook": "set" if DISCORD_WEBHOOK_URL else "not set",
+        "log_file": LOG_FILE_PATH,
+        "secret_token": "set" if SECRET_TOKEN else "not set",
+        "server_port": SERVER_PORT,
+    },
+)
+
+@dataclass
+class LogFileState:
+    """Memoized view of the log file's filesystem state.
+
+    Stat results are cached for a short TTL so hot paths (status polls,
+    tail reads) do not pay one syscall per request.
+    """
+
+    path: Path
+    _stat_ts: float = field(default=0.0, repr=False)
+    _stat: os.stat_result = field(default=None, repr=False)
+
+    def stat(self, ttl=0.5):
+        """Return the cached stat result, or None if the file is missing."""
+        now = time.monotonic()
+        if now - self._stat_ts > ttl:
+            try:
+                self._stat = self.path.stat()
+            except OSError:
+                self._stat = None
+            self._stat_ts = now
+        return self._stat
+
+    def exists(self, ttl=0.5):
+        """Check whether the log file exists, via the cached stat."""
+        return self.stat(ttl) is not None
+
+
+LOG_STATE = LogFileState(Path(LOG_FILE_PATH)) if LOG_FILE_PATH else None
+
+# Initialize the Flask app
+logger.debug("Initializing Flask application")
+app = Flask(__name__)
+
+# Global variables
+rcon_connected = False
+log_watcher_active = False
+
+# Important log patterns
+logger.debug("Compiling log pattern regular expressions")
+IMPORTANT_PATTERNS = [
+    r"joined the game",
+    r"left the game",
+    r"Starting minecraft server",
+    r"Stopping server",
+    r"\[ERROR\]",
+    r"SEVERE",
+    r"was slain by",
+    r"was killed by",
+    r"Can't keep up!",
+    r"issued server command",
+]
+
+# Everything except "\[ERROR\]" is a plain literal, so an Aho-Corasick
+# automaton can match all of them in one scan; the bracket pattern stays
+# as a tiny residual regex
+_LITERAL_PATTERNS = [p for p in IMPORTANT_PATTERNS if p != r"\[ERROR\]"]
+_RESIDUAL_REGEX = re.compile(r"\[ERROR\]", re.IGNORECASE)
+
+# Lowercased needles for the no-automaton path: tuple `in` checks use
+# the C substring scan, which beats any regex for plain literals
+_LITERAL_NEEDLES = tuple(p.lower() for p in _LITERAL_PATTERNS)
+
+if ahocorasick is not None:
+    logger.debug("Building Aho-Corasick automaton for literal log patterns")
+    _AUTOMATON = ahocorasick.Automaton()
+    for _literal in _LITERAL_PATTERNS:
+        _AUTOMATON.add_word(_literal.lower(), _literal)
+    _AUTOMATON.make_automaton()
+else:
+    _AUTOMATON = None
+
+
+# Shortest literal stem of each pattern; a line containing none of these
+# cannot match any pattern, and the `in` operator rejects it with a
+# C-level substring scan long before the full matchers run
+_STEMS = ("game", "server", "error", "severe", "slain", "killed", "keep up")
+
+# Coarse byte-level candidate filter for the watcher's bulk path: one
+# C-level scan of an appended region yields only the lines containing a
+# stem, so Python never materializes the boring ones. Each candidate is
+# then confirmed by is_important_log, the single classifier. The stems
+# are plain literals, so the alternation cannot backtrack
+# pathologically.
+_CANDIDATE_LINE_RE = re.compile(
+    rb"(?im)^.*(?:"
+    + "|".join(re.escape(stem) for stem in _STEMS).encode("utf-8")
+    + rb").*$"
+)
+
+# Byte form of the stems so whole blocks can be rejected with `in`
+# scans before the candidate regex runs at all
+_STEMS_BYTES = tuple(stem.encode("utf-8") for stem in _STEMS)
+
+
+def is_important_log(
+    line,
+    _automaton=_AUTOMATON,
+    _residual_search=_RESIDUAL_REGEX.search,
+    _needles=_LITERAL_NEEDLES,
+    _stems=_STEMS,
+):
+    """Check if a log line matches any important patterns.
+
+    The matchers are bound as default arguments so each call resolves
+    them as locals instead of global + attribute lookups.
+    """
+    lower = line.lower()
+    if not any(stem in lower for stem in _stems):
+        return False
+
+    if _automaton is not None:
+        if next(_automaton.iter(lower), None) is not None:
+            return True
+    elif any(needle in lower for needle in _needles):
+        return True
+    return _residual_search(line) is not None
+
+
+class MinecraftRCON:
+    """Class to handle RCON connections to the Minecraft server."""
+
+    # Seconds between heartbeat commands keeping the connection warm
+    HEARTBEAT_INTERVAL = 30.0
+
+    def __init__(self, host, port, password):
+        logger.debug("Initializing MinecraftRCON with host: %s, port: %s", host, port)
+        self.host = host
+        self.port = port
+        self.password = password
+        self.rcon = None
+        self._heartbeat = None
+        # Serializes all traffic on the single RCON connection; waitress
+        # worker threads and the heartbeat would otherwise interleave
+        # packets on the same socket. Reentrant so the reconnect path
+        # inside command() can call disconnect/connect while holding it.
+        self._lock = threading.RLock()
+
+    def _enable_keepalive(self):
+        """Enable TCP keepalive probes on the underlying RCON socket."""
+        sock = self.rcon.socket
+        sock.setsockopt(socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1)
+        # Linux-specific knobs: probe after 60s idle, then every 15s
+        if hasattr(socket, "TCP_KEEPIDLE"):
+            sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_KEEPIDLE, 60)
+        if hasattr(socket, "TCP_KEEPINTVL"):
+            sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_KEEPINTVL, 15)
+
+    def _heartbeat_loop(self):
+        """Periodically run a cheap command so the connection never idles out."""
+        while True:
+            time.sleep(self.HEARTBEAT_INTERVAL)
+            if not rcon_connected:
+                continue
+            try:
+                with self._lock:
+                    self.rcon.command("list")
+                logger.debug("RCON heartbeat ok")
+            except Exception as e:
+                logger.warning("RCON heartbeat failed: %s", str(e))
+
+    def connect(self):
+        """Connect to the Minecraft server via RCON."""
+        global rcon_connected
+        logger.info("Attempting to connect to RCON at %s:%s", self.host, self.port)
+
+        try:
+            logger.debug("Creating MCRcon instance")
+            self.rcon = MCRcon(self.host, self.password, self.port)
+
+            logger.debug("Establishing RCON connection")
+            self.rcon.connect()
+
+            # Keepalive probes stop NAT/firewall idle timeouts from
+            # silently dropping the connection between commands
+            try:
+                self._enable_keepalive()
+            except OSError as e:
+                logger.debug("Could not enable TCP keepalive: %s", str(e))
+
+            # Test the connection with a simple command
+            logger.debug("Testing RCON connection with 'list' command")
+            test_response = self.rcon.command("list")
+            logger.info("RCON test response: %s", test_response)
+
+            rcon_connected = True
+            logger.info("Successfully connected to Minecraft RCON")
+            send_webhook_message("✅ Connected to Minecraft server RCON")
+
+            if self._heartbeat is None:
+                self._heartbeat = threading.Thread(
+                    target=self._heartbeat_loop, daemon=True
+                )
+                self._heartbeat.start()
+            return True
+        except ConnectionRefusedError as e:
+            rcon_connected = False
+            logger.error("RCON connection refused: %s", str(e))
+            logger.error(
+                "Check if the Minecraft server is running and RCON is properly configured"
+            )
+            send_webhook_message(
+                "❌ RCON connection refused. Is the Minecraft server running?"
+            )
+            return False
+        except Exception as e:
+            rcon_connected = False
+            logger.error("RCON connection error: %s", str(e))
+
+            # More detailed error logging for debugging
+            error_type = type(e).__name__
+            logger.error("Error type: %s", error_type)
+
+            if "unpack requires a buffer of 8 bytes" in str(e):
+                logger.error(
+                    "This error often occurs due to connection issues or wrong credentials"
+                )
+                logger.error(
+                    "Connection details - Host: %s, Port: %s, Password length: %d",
+                    self.host,
+                    self.port,
+                    len(self.password),
+                )
+
+            send_webhook_message(f"❌ RCON connection error: {str(e)}")
+            return False
+
+    def disconnect(self):
+        """Disconnect from the Minecraft server."""
+        global rcon_connected
+        logger.info("Disconnecting from Minecraft RCON")
+        try:
+            with self._lock:
+                if self.rcon:
+                    self.rcon.disconnect()
+                    rcon_connected = False
+                    logger.info("Successfully disconnected from Minecraft RCON")
+                else:
+                    logger.warning("Disconnect called but RCON was not connected")
+        except Exception as e:
+            logger.error("Error disconnecting from RCON: %s", str(e))
+
+    def command(self, cmd):
+        """Execute a command on the Minecraft server."""
+        logger.info("Executing Minecraft command: %s", cmd)
+        with self._lock:
+            try:
+                if not rcon_connected:
+                    logger.warning(
+                        "Attempted to execute command while disconnected from RCON"
+                    )
+                    return "Not connected to Minecraft server"
+
+                logger.debug("Sending command via RCON")
+                response = self.rcon.command(cmd)
+                logger.debug("Command response: %s", response)
+                return response
+            except (ConnectionResetError, BrokenPipeError, socket.timeout) as e:
+                logger.error("Connection lost while executing command: %s", str(e))
+                logger.info("Attempting to reconnect to RCON")
+                self.disconnect()
+                # Exponential backoff gives a restarting server a few
+                # seconds to come back instead of failing on one
+                # immediate retry
+                for attempt in range(3):
+                    if self.connect():
+                        try:
+                            logger.info("Reconnected, retrying command: %s", cmd)
+                            response = self.rcon.command(cmd)
+                            logger.debug(
+                                "Command response after reconnect: %s", response
+                            )
+                            return response
+                        except Exception as e2:
+                            logger.error(
+                                "Error executing command after reconnect: %s", str(e2)
+                            )
+                            return f"Error: {str(e2)}"
+                    delay = min(30, 2**attempt)
+                    logger.info(
+                        "Reconnect attempt %d failed, retrying in %ds",
+                        attempt + 1,
+                        delay,
+                    )
+                    time.sleep(delay)
+                return f"Error: Connection lost and reconnection failed"
+            except Exception as e:
+                logger.error("Error executing command: %s", str(e))
+                return f"Error: {str(e)}"
+
+
+class LogWatcher(PatternMatchingEventHandler):
+    """Watch the Minecraft log file for changes."""
+
+    def __init__(self, file_path):
+        logger.debug("Initializing LogWatcher for file: %s", file_path)
+        # Filter at dispatch time: only modification events for the log
+        # file itself reach the handler; rotations and directory noise
+        # are dropped inside watchdog
+        super().__init__(patterns=[file_path], ignore_directories=True)
+        self.file_path = file_path
+        self._file = None
+        self._inode = None
+        # Serializes reads and handle swaps; watchdog may dispatch from a
+        # different thread than the drain loop
+        self._lock = threading.Lock()
+
+        # Open the log once and keep the handle; each event then reads
+        # only the newly appended region instead of paying stat + open +
+        # seek syscalls per modification
+        try:
+            if os.path.exists(file_path):
+                self._file = open(file_path, "rb")
+                self._file.seek(0, os.SEEK_END)
+                self._inode = os.fstat(self._file.fileno()).st_ino
+                logger.info(
+                    "Initialized log watcher at position %d bytes", self._file.tell()
+                )
+            else:
+                logger.error("Log file not found: %s", file_path)
+                send_webhook_message(f"❌ Log file not found: {file_path}")
+        except Exception as e:
+            logger.error("Error initializing log watcher: %s", str(e))
+
+        # Coalesce modification-event storms: on_modified only sets a
+        # flag, and this thread collapses any burst into a single read
+        self._wake = threading.Event()
+        self._drain_thread = threading.Thread(target=self._drain_loop, daemon=True)
+        self._drain_thread.start()
+
+    # Upper bound between reads; the loop degrades to a plain polling
+    # tail at this cadence if modification events are delayed or dropped
+    POLL_INTERVAL = 1.0
+
+    def _drain_loop(self):
+        """Drain new log content on modification events or a poll tick.
+
+        Waiting with a timeout turns this into a bounded polling loop:
+        under write bursts the cost is one read per tick regardless of
+        how many kernel events fire, and an inotify queue overflow can
+        never stall the tail.
+        """
+        while True:
+            self._wake.wait(timeout=self.POLL_INTERVAL)
+            self._wake.clear()
+            self.process_new_log_entries()
+            # Short pause so an event storm becomes one read per window
+            time.sleep(0.1)
+
+    def _reopen_if_rotated(self):
+        """Reopen the log file if it was rotated or truncated under us."""
+        try:
+            stat = os.stat(self.file_path)
+        except OSError:
+            return
+
+        if self._file is None or stat.st_ino != self._inode:
+            logger.info("Log file appears to have been rotated, reopening")
+            if self._file is not None:
+                self._file.close()
+            self._file = open(self.file_path, "rb")
+            self._inode = stat.st_ino
+        elif stat.st_size < self._file.tell():
+            logger.info("Log file truncated, resetting position")
+            self._file.seek(0)
+
+    def on_modified(self, event):
+        """Handle log file modification events."""
+        # The observer watches the log file itself, so every event here
+        # is for our file; no path compare needed
+        logger.debug("Log file modified, waking drain thread")
+        self._wake.set()
+
+    # Upper bound on bytes read per pass; a rotation-adjacent burst is
+    # processed in fixed-size blocks instead of one delta-sized buffer
+    READ_BLOCK = 1 << 20
+
+    def process_new_log_entries(self):
+        """Process new entries in the log file."""
+        try:
+            # Check the debug level once so the loop bodies pay no
+            # logging cost per line when it is disabled
+            debug_enabled = logger.isEnabledFor(logging.DEBUG)
+            important_count = 0
+
+            while True:
+                with self._lock:
+                    self._reopen_if_rotated()
+                    if self._file is None:
+                        return
+
+                    data = self._file.read(self.READ_BLOCK)
+                    if not data:
+                        break
+                    short_read = len(data) < self.READ_BLOCK
+
+                    # Hold back any partial trailing line for the next
+                    # pass so a mid-write line is never reported in two
+                    # halves
+                    cut = data.rfind(b"\n")
+                    if cut < 0:
+                        self._file.seek(-len(data), os.SEEK_CUR)
+                        break
+                    if cut + 1 < len(data):
+                        self._file.seek(cut + 1 - len(data), os.SEEK_CUR)
+                        data = data[: cut + 1]
+
+                # A block whose lowercased bytes contain no stem cannot
+                # hold an important line; the C-level substring scans
+                # are far cheaper than the regex pass they skip
+                lower = data.lower()
+                if any(stem in lower for stem in _STEMS_BYTES):
+                    # One regex pass over the raw bytes narrows the
+                    # block to candidate lines; only those are decoded
+                    # and handed to the classifier for the exact check
+                    for match in _CANDIDATE_LINE_RE.finditer(data):
+                        line = match.group(0).decode("utf-8", "replace").rstrip("\r")
+                        if not is_important_log(line):
+                            continue
+                        if debug_enabled:
+                            logger.debug("Found important log entry: %.50s", line)
+                        enqueue_log_line(line)
+                        important_count += 1
+
+                if short_read:
+                    break
+
+            logger.debug("Advanced log position to %d", self._file.tell())
+
+            if important_count > 0:
+                logger.info(
+                    "Queued %d important log entries for Discord", important_count
+                )
+            else:
+                logger.debug("No important log entries found in new content")
+
+        except Exception as e:
+            logger.error("Error processing log file: %s", str(e))
+            logger.exception("Detailed traceback:")
+
+
+# Keep-alive session shared by all webhook posts so repeat notifications
+# reuse one TLS connection instead of handshaking per message
+_WEBHOOK_SESSION = requests.Session()
+_WEBHOOK_SESSION.mount(
+    "https://",
+    requests.adapters.HTTPAdapter(pool_connections=1, pool_maxsize=4, max_retries=1),
+)
+
+
+# Webhook deliveries are queued and posted by a dedicated daemon thread
+# so callers (the log watcher in particular) never block on HTTPS
+_WEBHOOK_QUEUE = queue.Queue(maxsize=512)
+_dropped_messages = 0
+
+
+def send_webhook_message(content, embed=None):
+    """Queue a message for delivery to the Discord webhook."""
+    global _dropped_messages
+
+    if not DISCORD_WEBHOOK_URL:
+        logger.warning(
+            "Attempted to send webhook message but DISCORD_WEBHOOK_URL is not set"
+        )
+        return
+
+    try:
+        _WEBHOOK_QUEUE.put_nowait((content, embed))
+    except queue.Full:
+        _dropped_messages += 1
+        logger.warning(
+            "Webhook queue full, dropped %d messages so far", _dropped_messages
+        )
+
+
+def _webhook_worker():
+    """Drain the webhook queue and deliver messages in order."""
+    while True:
+        content, embed = _WEBHOOK_QUEUE.get()
+        try:
+            _post_webhook_message(content, embed)
+        finally:
+            _WEBHOOK_QUEUE.task_done()
+
+
+# Constant webhook identity shared by every post; only the content
+# varies per message
+_WEBHOOK_TEMPLATE = {
+    "username": "Minecraft Server Terminal",
+    "avatar_url": "https://www.minecraft.net/etc.clientlibs/minecraft/clientlibs/main/resources/img/minecraft-logo.png",
+    "timeout": 10,
+}
+
+
+# Circuit breaker: after several consecutive delivery failures stop
+# posting for a cooldown period instead of burning a timeout per message
+_BREAKER_THRESHOLD = 5
+_BREAKER_COOLDOWN = 30.0
+_fail_count = 0
+_open_until = 0.0
+
+
+def _post_webhook_message(content, embed=None):
+    """Deliver one message to the Discord webhook."""
+    global _fail_count, _open_until
+
+    if time.monotonic() < _open_until:
+        logger.debug("Webhook circuit open, dropping message")
+        return
+
+    logger.debug("Sending Discord webhook message: %.50s", content)
+    try:
+        webhook = DiscordWebhook(
+            url=DISCORD_WEBHOOK_URL, content=content, **_WEBHOOK_TEMPLATE
+        )
+        # Route the POST through the pooled keep-alive session
+        webhook.session = _WEBHOOK_SESSION
+
+        if embed:
+            logger.debug("Adding embed to webhook message")
+            webhook.add_embed(embed)
+
+        response = webhook.execute()
+
+        # Discord answers bursts with a 429 carrying retry_after; honor
+        # it once so the message lands instead of being dropped
+        if response.status_code == 429:
+            try:
+                retry_after = float(response.json().get("retry_after", 1.0))
+            except Exception:
+                retry_after = 1.0
+            logger.warning(
+                "Webhook rate limited, retrying after %.2fs", retry_after
+            )
+            time.sleep(retry_after)
+            response = webhook.execute()
+
+        if response.status_code == 204:
+            logger.debug("Webhook message sent successfully")
+            _fail_count = 0
+        else:
+            logger.warning(
+                "Webhook returned unexpected status code: %d", response.status_code
+            )
+    except Exception as e:
+        logger.error("Error sending webhook message: %s", str(e))
+        _fail_count += 1
+        if _fail_count >= _BREAKER_THRESHOLD:
+            _open_until = time.monotonic() + _BREAKER_COOLDOWN
+            _fail_count = 0
+            logger.warning(
+                "Webhook circuit opened for %.0fs after %d consecutive failures",
+                _BREAKER_COOLDOWN,
+                _BREAKER_THRESHOLD,
+            )
+
+
+# Start the webhook delivery thread as soon as the module is loaded
+threading.Thread(target=_webhook_worker, daemon=True).start()
+
+
+# Buffer important log lines and flush them together so a burst of
+# events costs one webhook round-trip instead of one per line
+BATCH_FLUSH_INTERVAL = 1.0
+_batch_queue = collections.deque()
+_batch_lock = threading.Lock()
+_batch_timer = None
+
+
+def enqueue_log_line(line):
+    """Queue a log line for the next batched webhook flush."""
+    global _batch_timer
+
+    with _batch_lock:
+        _batch_queue.append(line)
+        if _batch_timer is None:
+            _batch_timer = threading.Timer(BATCH_FLUSH_INTERVAL, flush_log_batch)
+            _batch_timer.daemon = True
+            _batch_timer.start()
+
+
+def flush_log_batch():
+    """Send all queued log lines as batched code-block messages."""
+    global _batch_timer
+
+    with _batch_lock:
+        lines = list(_batch_queue)
+        _batch_queue.clear()
+        _batch_timer = None
+
+    if not lines:
+        return
+
+    logger.debug("Flushing %d batched log lines to Discord", len(lines))
+    text = "\n".join(lines)
+
+    # Discord caps messages at 2000 characters; leave room for the fences
+    for i in range(0, len(text), 1900):
+        send_webhook_message(f"```{text[i:i+1900]}```")
+
+
+def get_recent_logs(lines=10):
+    """Get the most recent lines from the log file."""
+    logger.info("Retrieving %d recent log lines", lines)
+    try:
+        if not LOG_STATE.exists():
+            logger.error("Log file not found: %s", LOG_FILE_PATH)
+            return f"Log file not found: {LOG_FILE_PATH}"
+
+        logger.debug("Reading tail of log file: %s", LOG_FILE_PATH)
+        with open(LOG_FILE_PATH, "rb") as file:
+            try:
+                mm = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+            except ValueError:
+                # Empty files cannot be mapped
+                logger.debug("Log file is empty")
+                return ""
+
+            with mm:
+                # Walk backwards over newlines directly in the page cache;
+                # only the tail slice is ever copied out
+                size = len(mm)
+                pos = size - 1 if mm[size - 1 : size] == b"\n" else size
+                for _ in range(lines):
+                    pos = mm.rfind(b"\n", 0, pos)
+                    if pos < 0:
+                        break
+
+                start = 0 if pos < 0 else pos + 1
+                result = mm[start:size].decode("utf-8", errors="replace")
+
+        logger.debug("Retrieved %d bytes from log file tail", size - start)
+        return result
+    except Exception as e:
+        logger.error("Error getting recent logs: %s", str(e))
+        return f"Error reading logs: {str(e)}"
+
+
+def parse_json_body():
+    """Parse the request body as JSON, using orjson when available.
+
+    Returns None on a missing or malformed body, mirroring
+    request.get_json(silent=True).
+    """
+    if orjson is not None:
+        try:
+            return orjson.loads(request.get_data(cache=False))
+        except ValueError:
+            return None
+    return request.get_json(silent=True, cache=False)
+
+
+def json_response(payload, status=200):
+    """Serialize an API response, using orjson when available."""
+    if orjson is not None:
+        return Response(
+            orjson.dumps(payload), status=status, mimetype="application/json"
+        )
+    return jsonify(payload), status
+
+
+# API authentication middleware
+def verify_token(_secret=(SECRET_TOKEN or "").encode()):
+    """Verify the secret token in the request header.
+
+    compare_digest keeps the comparison constant-time so the token
+    cannot be probed byte by byte via response timing. The encoded
+    secret is bound as a default argument so each request resolves it
+    as a local instead of re-encoding the module global.
+    """
+    token = request.headers.get("X-Secret-Token")
+    result = hmac.compare_digest((token or "").encode(), _secret)
+    if not result:
+        logger.warning("API request with invalid token received")
+    return result
+
+
+# Flask routes
+@app.route("/command", methods=["POST"])
+def handle_command():
+    """Handle command execution requests."""
+    logger.info("Received command execution request")
+
+    if not verify_token():
+        logger.warning("Unauthorized command request rejected")
+        return json_response({"error": "Unauthorized"}, 401)
+
+    # Reject oversized bodies before parsing; commands are tiny
+    if request.content_length is not None and request.content_length > 4096:
+        logger.warning("Command request body too large: %d bytes", request.content_length)
+        return json_response({"error": "Request body too large"}, 413)
+
+    data = parse_json_body()
+    if not isinstance(data, dict) or "command" not in data:
+        logger.warning("Received command request without 'command' field")
+        return json_response({"error": "Command is required"}, 400)
+
+    command = data["command"]
+    logger.info("Executing command: %s", command)
+    result = minecraft_rcon.command(command)
+
+    logger.debug("Command result: %s", result)
+    return json_response(
+        {"success": True, "result": result or "Command executed (no response)"}
+    )
+
+
+@functools.lru_cache(maxsize=16)
+def _cached_tail(lines, epoch):
+    """Read the log tail once per second per line count.
+
+    The epoch-second key makes entries expire naturally, so a burst of
+    pollers within one second shares a single disk read.
+    """
+    return get_recent_logs(lines)
+
+
+@app.route("/logs", methods=["GET"])
+def handle_logs():
+    """Handle log retrieval requests."""
+    logger.info("Received logs request")
+
+    if not verify_token():
+        logger.warning("Unauthorized logs request rejected")
+        return json_response({"error": "Unauthorized"}, 401)
+
+    try:
+        lines = int(request.args.get("lines", 10))
+        logger.info("Retrieving %d log lines", lines)
+
+        if lines < 1 or lines > 100:
+            logger.warning("Invalid log lines parameter: %d", lines)
+            return json_response(
+                {"error": "Please request between 1 and 100 lines"}, 400
+            )
+
+        # ETag derived from (inode, size, lines): a polling client whose
+        # view is unchanged gets a 304 with no body instead of a fresh
+        # tail read and serialization
+        st = LOG_STATE.stat() if LOG_STATE is not None else None
+        etag = f'"{st.st_ino}-{st.st_size}-{lines}"' if st is not None else None
+        if etag is not None and request.headers.get("If-None-Match") == etag:
+            logger.debug("Log tail unchanged, returning 304")
+            return Response(status=304, headers={"ETag": etag})
+
+        logs = _cached_tail(lines, int(time.time()))
+        resp = app.make_response(json_response({"success": True, "logs": logs}))
+        if etag is not None:
+            resp.headers["ETag"] = etag
+        # A short freshness window keeps aggressive pollers off the disk
+        resp.headers["Cache-Control"] = "private, max-age=1"
+
+        # Log text compresses well; gzip bodies over 1 KB for clients
+        # that advertise support
+        body = resp.get_data()
+        if len(body) > 1024 and "gzip" in request.headers.get("Accept-Encoding", ""):
+            resp.set_data(gzip.compress(body, 5))
+            resp.headers["Content-Encoding"] = "gzip"
+        resp.headers["Vary"] = "Accept-Encoding"
+        return resp
+    except ValueError as e:
+        logger.error("Invalid lines parameter: %s", str(e))
+        return json_response({"error": "Invalid lines parameter"}, 400)
+
+
+@functools.lru_cache(maxsize=4)
+def _status_response(epoch, rcon, watcher):
+    """Build the status response, cached per second per state.
+
+    /status is idempotent within a second, so concurrent pollers share
+    one dict construction and serialization instead of paying it per
+    request.
+    """
+    return json_response(
+        {
+            "success": True,
+            "status": {
+                "rconConnected": rcon,
+                "logWatcherActive": watcher,
+            },
+        }
+    )
+
+
+@app.route("/status", methods=["GET"])
+def handle_status():
+    """Handle status check requests."""
+    logger.info("Received status request")
+
+    if not verify_token():
+        logger.warning("Unauthorized status request rejected")
+        return json_response({"error": "Unauthorized"}, 401)
+
+    return _status_response(int(time.time()), rcon_connected, log_watcher_active)
+
+
+def start_log_watcher():
+    """Start watching the log file for changes."""
+    global log_watcher_active
+
+    if not LOG_FILE_PATH:
+        logger.error("LOG_FILE_PATH not set, cannot start log watcher")
+        return None
+
+    logger.info("Starting log watcher for: %s", LOG_FILE_PATH)
+
+    if not LOG_STATE.exists(ttl=0):
+        logger.error("Log file not found: %s", LOG_FILE_PATH)
+        send_webhook_message(f"❌ Log file not found: {LOG_FILE_PATH}")
+        return None
+
+    try:
+        logger.debug("Setting up log watcher for file: %s", LOG_FILE_PATH)
+
+        # Watch the log file itself rather than its directory, so writes
+        # to sibling files (debug.log, compressed rotations) never reach
+        # the handler at all
+        event_handler = LogWatcher(LOG_FILE_PATH)
+        observer = InotifyObserver() if InotifyObserver is not None else Observer()
+        observer.schedule(event_handler, LOG_FILE_PATH, recursive=False)
+        observer.start()
+
+        # Status requests read this flag instead of paying a stat() on
+        # every poll; it only changes here and at shutdown
+        log_watcher_active = True
+        logger.info("Log watcher started successfully")
+        return observer
+    except Exception as e:
+        logger.error("Failed to start log watcher: %s", str(e))
+        logger.exception("Detailed traceback:")
+        return None
+
+
+if __name__ == "__main__":
+    logger.info("Starting Minecraft Server Terminal")
+
+    # Check if required environment variables are set
+    missing_vars = []
+
+    if not MINECRAFT_RCON_PASSWORD:
+        missing_vars.append("MINECRAFT_RCON_PASSWORD")
+        logger.error("MINECRAFT_RCON_PASSWORD is not set")
+
+    if not DISCORD_WEBHOOK_URL:
+        missing_vars.append("DISCORD_WEBHOOK_URL")
+        logger.error("DISCORD_WEBHOOK_URL is not set")
+
+    if not SECRET_TOKEN:
+        missing_vars.append("SECRET_TOKEN")
+        logger.error("SECRET_TOKEN is not set")
+
+    if missing_vars:
+        logger.error(
+            "Required environment variables not set: %s", ", ".join(missing_vars)
+        )
+        logger.error("Please check your .env file")
+        sys.exit(1)
+
+    # Initialize RCON connection
+    logger.info("Initializing RCON connection to Minecraft server")
+    minecraft_rcon = MinecraftRCON("141.148.217.100", 25585, "iamyourfather")
+
+    # Connect to Minecraft server
+    connection_result = minecraft_rcon.connect()
+    if not connection_result:
+        logger.warning("Failed to connect to Minecraft server on startup")
+        logger.info("Continuing anyway - will retry on command execution")
+
+    # Start log watcher
+    observer = None
+    if LOG_FILE_PATH:
+        observer = start_log_watcher()
+        if not observer:
+            logger.warning("Log watcher failed to start")
+    else:
+        logger.warning("LOG_FILE_PATH not set, log watching is disabled")
+
+    try:
+        # Send startup notification
+        logger.info("Sending startup notification to Discord")
+        send_webhook_message("🚀 Minecraft Server Terminal is now online")
+
+        # Start the web server; waitress handles concurrent requests so
+        # /logs readers do not starve /command callers
+        if waitress_serve is not None:
+            logger.info("Starting waitress server on port %d", SERVER_PORT)
+            waitress_serve(app, host="0.0.0.0", port=SERVER_PORT, threads=8)
+        else:
+            logger.warning("waitress not installed, using Flask development server")
+            logger.info("Starting Flask server on port %d", SERVER_PORT)
+            app.run(host="0.0.0.0", port=SERVER_PORT)
+
+    except KeyboardInterrupt:
+        logger.info("Received keyboard interrupt, shutting down...")
+    except Exception as e:
+        logger.error("Error during server operation: %s", str(e))
+        logger.exception("Detailed traceback:")
+    finally:
+        logger.info("Performing cleanup tasks")
+
+        # Disconnect RCON
+        logger.info("Disconnecting from RCON")
+        minecraft_rcon.disconnect()
+
+        # Stop log watcher
+        if observer:
+            logger.info("Stopping log watcher")
+            log_watcher_active = False
+            observer.stop()
+            observer.join()
+
+        # Flush any log lines still waiting on the batch timer
+        flush_log_batch()
+
+        logger.info("Sending shutdown notification to Discord")
+        send_webhook_message("⚠️ Minecraft Server Terminal is shutting down")
+
+        # Let the delivery thread finish the queued messages before exit
+        _WEBHOOK_QUEUE.join()
+
+        logger.info("Shutdown complete")